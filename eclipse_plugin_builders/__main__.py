@@ -10,20 +10,26 @@ file of the Eclipse plugin.
 in the `pom.xml` file to build the `.classpath` file.
 """
 
+import collections.abc
+import concurrent.futures
+import contextlib
+import functools
+import hashlib
+import json
+import operator
 import os
 import pathlib
+import re
 import shutil
 import subprocess
 import sys
 import tempfile
 
 import click
-import lxml.builder
 import lxml.etree
 
 import eclipse_plugin_builders
 
-E = lxml.builder.ElementMaker()
 MANIFEST_PATH = pathlib.Path("META-INF/MANIFEST.MF")
 PLUGIN_XML_PATH = pathlib.Path("plugin.xml")
 PATH_BLACKLIST = (
@@ -39,6 +45,20 @@ PATH_BLACKLIST = (
     "jgit",
     "pydev",
 )
+PATH_BLACKLIST_RE = re.compile("|".join(map(re.escape, PATH_BLACKLIST)))
+BUNDLE_CLASSPATH_RE = re.compile(
+    rb"^Bundle-ClassPath:[^\r\n]*(?:\r?\n [^\r\n]*)*(?:\r?\n)?", re.MULTILINE
+)
+TARGET_PLATFORM_LIB_DIRS = ("dropins", "features", "jre", "plugins")
+POM_NAMESPACE = "http://maven.apache.org/POM/4.0.0"
+XML_PARSER = lxml.etree.XMLParser(
+    collect_ids=False, huge_tree=False, no_network=True, resolve_entities=False
+)
+THIRD_PARTY_LIBS_XPATH = lxml.etree.XPath(
+    'classpathentry[@kind="lib" and '
+    'not(starts-with(@path, "/opt/capella_6.0.0"))]/@path'
+)
+OUTPUT_XPATH = lxml.etree.XPath('//classpathentry[@kind="output"]')
 
 
 @click.group()
@@ -52,33 +72,65 @@ def main() -> None:
 
 
 def _third_party_lib_paths() -> list[pathlib.Path]:
-    """Return the paths to the third-party libraries."""
+    """Return the paths to the third-party libraries sorted by file name."""
     classpath_root = _read_xml_file(".classpath")
-    third_party_lib_paths = classpath_root.xpath(
-        'classpathentry[@kind="lib" and '
-        'not(starts-with(@path, "/opt/capella_6.0.0"))]/@path'
+    third_party_lib_paths = THIRD_PARTY_LIBS_XPATH(classpath_root)
+    return sorted(
+        (pathlib.Path(p) for p in third_party_lib_paths),
+        key=lambda p: (p.name, p),
     )
-    return sorted([pathlib.Path(p) for p in third_party_lib_paths])
 
 
+@functools.cache
 def compute_jar_name() -> str:
-    """Compute and return the name of the jar file to be built."""
-    pom = _read_xml_file("pom.xml")
-    # get the namespace from the root element
-    ns = {"m": "http://maven.apache.org/POM/4.0.0"}  # Register the namespace
-    group_id = pom.xpath("//m:groupId", namespaces=ns)
-    artifact_id = pom.xpath("//m:artifactId", namespaces=ns)
-    version = pom.xpath("//m:version", namespaces=ns)
-    group_id = group_id[0].text if group_id else "unknown"
-    artifact_id = artifact_id[0].text if artifact_id else "unknown"
-    version = version[0].text if version else "unknown"
+    """Compute and return the name of the jar file to be built.
+
+    The result is cached as the `pom.xml` file does not change during
+    a single CLI invocation. The `pom.xml` file is streamed and only
+    read until the project's own coordinates have been found. Missing
+    `groupId` and `version` are inherited from the `parent` element as
+    Maven does.
+    """
+    pom_path = pathlib.Path("pom.xml")
+    if not pom_path.exists():
+        click.echo(f"`File {pom_path}` not found.")
+        sys.exit(1)
+    project_tag = f"{{{POM_NAMESPACE}}}project"
+    parent_tag = f"{{{POM_NAMESPACE}}}parent"
+    tags = {
+        f"{{{POM_NAMESPACE}}}{name}": name
+        for name in ("groupId", "artifactId", "version")
+    }
+    coords: dict[str, str] = {}
+    parent_coords: dict[str, str] = {}
+    with pom_path.open("rb") as pom:
+        for _, elem in lxml.etree.iterparse(
+            pom,
+            events=("end",),
+            tag=tuple(tags),
+            collect_ids=False,
+            huge_tree=False,
+            no_network=True,
+            resolve_entities=False,
+        ):
+            container = elem.getparent()
+            if container.tag == project_tag:
+                coords.setdefault(tags[elem.tag], elem.text)
+                if len(coords) == len(tags):
+                    break
+            elif container.tag == parent_tag:
+                parent_coords.setdefault(tags[elem.tag], elem.text)
+            elem.clear()
+    group_id = coords.get("groupId") or parent_coords.get("groupId", "unknown")
+    artifact_id = coords.get("artifactId", "unknown")
+    version = coords.get("version") or parent_coords.get("version", "unknown")
     return f"{group_id}.{artifact_id}_{version}.jar"
 
 
 def _output_and_jar_path() -> tuple[pathlib.Path, pathlib.Path]:
     """Return paths to output dir and the jar file to be built."""
     classpath_root = _read_xml_file(".classpath")
-    output = classpath_root.xpath('//classpathentry[@kind="output"]')
+    output = OUTPUT_XPATH(classpath_root)
     if not output:
         click.echo(
             "Output directory not found. Missing `classpathentry` with kind "
@@ -86,7 +138,9 @@ def _output_and_jar_path() -> tuple[pathlib.Path, pathlib.Path]:
         )
         sys.exit(1)
     output_path = pathlib.Path(output[0].get("path"))
-    if not list(output_path.iterdir()):
+    with os.scandir(output_path) as it:
+        is_empty = next(it, None) is None
+    if is_empty:
         click.echo(f"Output directory `{output_path}` is empty.")
         sys.exit(1)
     jar_name = compute_jar_name()
@@ -99,63 +153,190 @@ def _read_xml_file(path: str) -> lxml.etree.Element:
     if not pathlib.Path(path).exists():
         click.echo(f"`File {path}` not found.")
         sys.exit(1)
-    tree = lxml.etree.parse(path)
-    return tree
+    return _parse_xml_file(
+        os.path.abspath(path), pathlib.Path(path).stat().st_mtime_ns
+    )
+
+
+@functools.cache
+def _parse_xml_file(path: str, mtime_ns: int) -> lxml.etree.Element:
+    """Parse an XML file once per path and modification time."""
+    del mtime_ns  # only part of the cache key
+    return lxml.etree.parse(path, XML_PARSER)
+
+
+def _walk_jars(
+    root: pathlib.Path,
+    rel_dir: str = "",
+    *,
+    recursive: bool = True,
+) -> collections.abc.Iterator[tuple[os.DirEntry[str], str]]:
+    """Yield all jar files below `root / rel_dir` in one directory walk.
+
+    Each jar is yielded together with the path of its parent directory
+    relative to `root`. Symbolic links to directories are not followed.
+    """
+    stack = [rel_dir]
+    while stack:
+        rel_parent = stack.pop()
+        try:
+            it = os.scandir(os.path.join(root, rel_parent))
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        stack.append(os.path.join(rel_parent, entry.name))
+                elif entry.name.endswith(".jar") and entry.is_file():
+                    yield entry, rel_parent
+
+
+def _walk_jars_concurrently(
+    root: pathlib.Path, jobs: int
+) -> collections.abc.Iterator[tuple[os.DirEntry[str], str]]:
+    """Walk the top-level directories of `root` on a thread pool.
+
+    Overlaps the directory reads of up to `jobs` top-level directories,
+    which pays off on slow or network file systems. Unlike in nested
+    directories, symbolic links are followed for top-level directories,
+    as `plugins` or `dropins` are often links to shared directories.
+    """
+    yield from _walk_jars(root, recursive=False)
+    with os.scandir(root) as it:
+        top_dirs = [e.name for e in it if e.is_dir()]
+    with concurrent.futures.ThreadPoolExecutor(jobs) as executor:
+        for jars in executor.map(
+            lambda top_dir: list(_walk_jars(root, top_dir)), top_dirs
+        ):
+            yield from jars
+
+
+def _scan_target_platform(
+    target_path: pathlib.Path, jobs: int = 1
+) -> list[tuple[str, str | None]]:
+    """Return `(path, sourcepath)` pairs of the target platform jars.
+
+    The pairs are sorted by `path`. The `sourcepath` is `None` for jars
+    without a source jar.
+    """
+    # Jars keyed by parent dir and lib name, i.e. `.source_` replaced:
+    sources: dict[tuple[str, str], str] = {}
+    libs: dict[tuple[str, str], str] = {}
+    for entry, rel_parent in _walk_jars_concurrently(target_path, jobs):
+        if ".source_" in entry.name:
+            key = (rel_parent, entry.name.replace(".source_", "_"))
+            sources[key] = entry.path
+        else:
+            libs[rel_parent, entry.name] = entry.path
+    jars: list[tuple[str, str | None]] = []
+    for key, src in sources.items():
+        if PATH_BLACKLIST_RE.search(src):
+            continue
+        if (lib := libs.pop(key, None)) is not None:
+            jars.append((lib, src))
+    for (rel_parent, _), lib in libs.items():
+        if rel_parent.split(os.sep, 1)[0] not in TARGET_PLATFORM_LIB_DIRS:
+            continue
+        if not PATH_BLACKLIST_RE.search(lib):
+            jars.append((lib, None))
+    jars.sort(key=operator.itemgetter(0))
+    return jars
+
+
+def _target_platform_cache_key(target_path: pathlib.Path) -> list[object]:
+    """Return a key that changes when the target platform changes.
+
+    Only the modification times of the installation directory and its
+    top-level lib directories are considered. Changes nested deeper
+    are not detected, which is sufficient for Eclipse installations.
+    """
+    mtimes: list[int | None] = []
+    for dir_ in ("", *TARGET_PLATFORM_LIB_DIRS):
+        try:
+            mtimes.append((target_path / dir_).stat().st_mtime_ns)
+        except FileNotFoundError:
+            mtimes.append(None)
+    # The scanned paths are joined onto `target_path` as given, so a
+    # relative and an absolute path to the same directory must not
+    # share a cache entry.
+    return [
+        eclipse_plugin_builders.__version__,
+        str(target_path),
+        str(target_path.absolute()),
+        mtimes,
+    ]
+
+
+def _cache_dir() -> pathlib.Path:
+    """Return the directory for cached data of this package."""
+    cache_home = (
+        os.environ.get("XDG_CACHE_HOME") or pathlib.Path.home() / ".cache"
+    )
+    return pathlib.Path(cache_home) / "eclipse-plugin-builders"
+
+
+def _cached_scan_target_platform(
+    target_path: pathlib.Path, jobs: int = 1
+) -> list[tuple[str, str | None]]:
+    """Scan the target platform or load the result of a previous scan."""
+    try:
+        cache_dir = _cache_dir()
+    except RuntimeError:  # no home directory to put the cache into
+        return _scan_target_platform(target_path, jobs)
+    digest = hashlib.sha256(
+        f"{target_path}\0{target_path.absolute()}".encode()
+    ).hexdigest()
+    cache_path = cache_dir / f"target-platform-{digest[:16]}.json"
+    key = _target_platform_cache_key(target_path)
+    try:
+        cache = json.loads(cache_path.read_bytes())
+        if cache["key"] == key:
+            return [(path, sourcepath) for path, sourcepath in cache["jars"]]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    jars = _scan_target_platform(target_path, jobs)
+    tmp_name = None
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=cache_dir, delete=False
+        ) as w:
+            tmp_name = w.name
+            json.dump({"key": key, "jars": jars}, w)
+        os.replace(tmp_name, cache_path)
+    except OSError:
+        if tmp_name is not None:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_name)
+        click.echo(f"Cannot write target platform cache `{cache_path}`.")
+    return jars
 
 
 def _collect_target_platform_plugins(
     target_path: pathlib.Path,
+    *,
+    use_cache: bool = True,
+    jobs: int = 1,
 ) -> list[lxml.etree.Element]:
     """Add the target platform plugins to the classpath."""
-    # Recursively find all src JARs:
-    sources: set[pathlib.Path] = set(target_path.glob("**/*.source_*.jar"))
-    # Recursively find all lib JARs:
-    dropins_jars = list(target_path.glob("dropins/**/*.jar"))
-    features_jars = list(target_path.glob("features/**/*.jar"))
-    jre_jars = list(target_path.glob("jre/**/*.jar"))
-    plugins_jars = list(target_path.glob("plugins/**/*.jar"))
-    libs = list(
-        set(dropins_jars + features_jars + jre_jars + plugins_jars) - sources
-    )
-    libs = [lst for lst in libs if not lst.name == compute_jar_name()]
-    srcs = list(sources)
+    jar_name = compute_jar_name()
+    if use_cache:
+        jars = _cached_scan_target_platform(target_path, jobs)
+    else:
+        jars = _scan_target_platform(target_path, jobs)
     target_classpaths = []
-    for src in srcs:
-        skip = False
-        for pattern in PATH_BLACKLIST:
-            skip = pattern in str(src)
-            if skip:
-                break
-        if skip:
-            continue
-        # get parent dir
-        parent = src.parent
-        # get base name
-        base = src.name
-        lib = parent / base.replace(".source_", "_")
-        try:
-            libs.remove(lib)
-        except ValueError:
-            pass
-        if lib.is_file() and src.is_file():
+    for lib, src in jars:
+        if src is not None:
             target_classpaths.append(
-                E.classpathentry(
-                    kind="lib", path=str(lib), sourcepath=str(src)
+                lxml.etree.Element(
+                    "classpathentry", kind="lib", path=lib, sourcepath=src
                 )
             )
-    for lib in libs:
-        skip = False
-        for pattern in PATH_BLACKLIST:
-            skip = pattern in str(lib)
-            if skip:
-                break
-        if skip:
-            continue
-        if lib.is_file():
+        elif lib.rpartition(os.sep)[2] != jar_name:
             target_classpaths.append(
-                E.classpathentry(kind="lib", path=str(lib))
+                lxml.etree.Element("classpathentry", kind="lib", path=lib)
             )
-    target_classpaths.sort(key=lambda x: x.get("path"))  # type: ignore
     return target_classpaths
 
 
@@ -164,8 +345,32 @@ def _collect_target_platform_plugins(
 @click.argument(
     "target_platform_path", type=click.Path(exists=True, dir_okay=True)
 )
+@click.option(
+    "--mvn-artifact-threads",
+    default=8,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Number of threads Maven downloads dependencies with.",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Rescan the target platform instead of using the cached scan.",
+)
+@click.option(
+    "--jobs",
+    default=4,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Number of threads scanning the target platform.",
+)
 def build_classpath(
-    filename: pathlib.Path, target_platform_path: pathlib.Path
+    filename: pathlib.Path,
+    target_platform_path: pathlib.Path,
+    *,
+    mvn_artifact_threads: int,
+    no_cache: bool,
+    jobs: int,
 ) -> None:
     """Build `.classpath` file.
 
@@ -178,6 +383,16 @@ def build_classpath(
         The installation directory of an Eclipse/ Capella application
         that will be referenced as target platform to build the
         classpath.
+    mvn_artifact_threads : int
+        Number of threads Maven uses to download the dependencies and
+        their POMs, which dominates the first build of a classpath.
+    no_cache : bool
+        Whether to ignore the cached scan of the target platform. The
+        cache is invalidated when the modification time of the target
+        platform dir or one of its top-level lib dirs changes.
+    jobs : int
+        Number of top-level directories of the target platform that
+        are scanned concurrently.
     """
     target_path = pathlib.Path(target_platform_path)
     if not target_path.is_dir():
@@ -185,58 +400,85 @@ def build_classpath(
             f"Target platform installation dir `{target_path}` not found."
         )
         sys.exit(1)
-    classpaths = [
-        E.classpathentry(kind="src", path="src", including="**/*.java"),
-        E.classpathentry(kind="output", path="target/classes"),
-        E.classpathentry(
-            # TODO: Make the JRE version configurable
-            kind="con",
-            path=(
-                "org.eclipse.jdt.launching.JRE_CONTAINER/"
-                "org.eclipse.jdt.internal.debug.ui.launcher.StandardVMType/"
-                "JavaSE-17"
-            ),
+    classpath = lxml.etree.Element("classpath")
+    lxml.etree.SubElement(
+        classpath,
+        "classpathentry",
+        kind="src",
+        path="src",
+        including="**/*.java",
+    )
+    lxml.etree.SubElement(
+        classpath, "classpathentry", kind="output", path="target/classes"
+    )
+    lxml.etree.SubElement(
+        classpath,
+        "classpathentry",
+        # TODO: Make the JRE version configurable
+        kind="con",
+        path=(
+            "org.eclipse.jdt.launching.JRE_CONTAINER/"
+            "org.eclipse.jdt.internal.debug.ui.launcher.StandardVMType/"
+            "JavaSE-17"
         ),
+    )
+    # Let Maven write the classpath to our pipe instead of a file. `-N`
+    # keeps reactor modules from writing their classpaths to it, too:
+    mvn_cmd = [
+        "mvn",
+        "-q",
+        "-N",
+        f"-Dmaven.artifact.threads={mvn_artifact_threads}",
+        "dependency:build-classpath",
+        "-Dmdep.outputFile=/dev/stdout",
     ]
-    with tempfile.NamedTemporaryFile(mode="w", delete=False) as w:
-        mvn_cmd = [
-            "mvn",
-            "-q",
-            "dependency:build-classpath",
-            f"-Dmdep.outputFile={w.name}",
-        ]
-
-        def find_eclipse_jdtls_project_directory() -> pathlib.Path | None:
-            path = pathlib.Path(filename)
-            for parent in path.parents:
-                if (parent / ".project").is_file() and (
-                    parent / "pom.xml"
-                ).is_file():
-                    return parent
-            return None
-
-        project_dir = find_eclipse_jdtls_project_directory()
-        if project_dir is None:
-            raise RuntimeError(
-                "Could not find a valid Eclipse JDTLS project directory."
-                " containing a `.project` and a `pom.xml` file."
-            )
-        os.chdir(project_dir)
-        print(f"Building classpath for project in `{project_dir}`")
-        # Run command and wait:
-        result = subprocess.run(
-            mvn_cmd, capture_output=True, text=True, cwd=project_dir
+
+    def find_eclipse_jdtls_project_directory() -> pathlib.Path | None:
+        path = pathlib.Path(filename)
+        for parent in path.parents:
+            if (parent / ".project").is_file() and (
+                parent / "pom.xml"
+            ).is_file():
+                return parent
+        return None
+
+    project_dir = find_eclipse_jdtls_project_directory()
+    if project_dir is None:
+        raise RuntimeError(
+            "Could not find a valid Eclipse JDTLS project directory."
+            " containing a `.project` and a `pom.xml` file."
+        )
+    os.chdir(project_dir)
+    print(f"Building classpath for project in `{project_dir}`")
+    # Scan the target platform while draining Maven's output:
+    with (
+        subprocess.Popen(
+            mvn_cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            cwd=project_dir,
+        ) as proc,
+        concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor,
+    ):
+        future = executor.submit(
+            _collect_target_platform_plugins,
+            target_path,
+            use_cache=not no_cache,
+            jobs=jobs,
         )
-        if result.returncode != 0:
-            raise RuntimeError(result.stdout)
-    with open(w.name, "r", encoding="utf-8") as tmp:
-        # Replace all colons with newlines and sort the lines:
-        classpath_3rdparty = tmp.read().replace(":", "\n").splitlines()
+        stdout, _ = proc.communicate()
+        target_classpaths = future.result()
+    if proc.returncode != 0:
+        raise RuntimeError(stdout)
+    # Replace all colons with newlines and sort the lines:
+    classpath_3rdparty = stdout.replace(":", "\n").splitlines()
     classpath_3rdparty.sort()
     for path in classpath_3rdparty:
-        classpaths.append(E.classpathentry(kind="lib", path=path))
-    target_classpaths = _collect_target_platform_plugins(target_path)
-    classpath = E.classpath(*(classpaths + target_classpaths))
+        lxml.etree.SubElement(
+            classpath, "classpathentry", kind="lib", path=path
+        )
+    classpath.extend(target_classpaths)
     tree = lxml.etree.ElementTree(classpath)
     xml_string = lxml.etree.tostring(
         tree, xml_declaration=True, encoding="utf-8", pretty_print=True
@@ -269,46 +511,68 @@ def deploy(target_path: pathlib.Path) -> None:
 
 
 def _get_bundle_classpath(third_party_lib_paths: list[pathlib.Path]) -> str:
-    lib_paths = sorted([p.name for p in _third_party_lib_paths()])
+    """Return the `Bundle-ClassPath` header for libs sorted by name."""
     value = "."
     if third_party_lib_paths:
         value = ".,\n"
-        value += ",\n".join(f" lib/{p}" for p in lib_paths)
+        value += ",\n".join(f" lib/{p.name}" for p in third_party_lib_paths)
     return f"Bundle-ClassPath: {value}"
 
 
 def _update_bundle_classpath(
     third_party_lib_paths: list[pathlib.Path],
 ) -> None:
-    manifest = MANIFEST_PATH.read_text(encoding="utf-8")
-    bundle_classpath = _get_bundle_classpath(third_party_lib_paths)
-    lines = manifest.splitlines()
-    manifest = ""
-    found_bundle_classpath = False
-    inside_bundle_classpath = False
-    for line in lines:
-        if line.startswith("Bundle-ClassPath:"):
-            found_bundle_classpath = True
-            manifest += bundle_classpath + "\n"
-            inside_bundle_classpath = True
-            continue
-        if inside_bundle_classpath:
-            if line.startswith(" "):
-                continue
-            else:
-                inside_bundle_classpath = False
-        manifest += line.rstrip() + "\n"
-    if bundle_classpath and not found_bundle_classpath:
-        if not manifest.endswith("\n"):
-            manifest += "\n"
-        manifest += bundle_classpath + "\n"
+    manifest = MANIFEST_PATH.read_bytes()
+    # Keep the line ending style of the existing manifest:
+    eol = b"\r\n" if b"\r\n" in manifest else b"\n"
+    bundle_classpath = (
+        _get_bundle_classpath(third_party_lib_paths)
+        .encode("utf-8")
+        .replace(b"\n", eol)
+        + eol
+    )
+    # Replace the header including its continuation lines:
+    manifest, found_bundle_classpath = BUNDLE_CLASSPATH_RE.subn(
+        lambda _: bundle_classpath, manifest
+    )
+    if manifest and not manifest.endswith(b"\n"):
+        manifest += eol
+    if not found_bundle_classpath:
+        manifest += bundle_classpath
     # ensure that the maximum line length is not exceeded
     # max = 72
     # manifest = "\n".join(
     #     line[:max] + "\n" + line[max:] if len(line) > max else line
     #     for line in manifest.splitlines()
     # )
-    MANIFEST_PATH.write_text(manifest, encoding="utf-8")
+    MANIFEST_PATH.write_bytes(manifest)
+
+
+def _fast_copy(src: pathlib.Path, dest: pathlib.Path) -> None:
+    """Copy a file within the kernel via `os.copy_file_range` if possible.
+
+    Falls back to `shutil.copy` where `copy_file_range` is not available
+    or fails, e.g. for copies across file systems on older kernels, or
+    stops before the whole file has been copied.
+    """
+    if not hasattr(os, "copy_file_range"):
+        shutil.copy(src, dest)
+        return
+    try:
+        with src.open("rb") as fsrc, dest.open("wb") as fdst:
+            remaining = os.fstat(fsrc.fileno()).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(
+                    fsrc.fileno(), fdst.fileno(), remaining
+                )
+                if not copied:
+                    # Some file systems report 0 instead of an error:
+                    raise OSError(f"Short copy of `{src}`")
+                remaining -= copied
+    except OSError:
+        shutil.copy(src, dest)
+        return
+    shutil.copymode(src, dest)
 
 
 @main.command()
@@ -320,10 +584,11 @@ def package() -> None:
     lib_dir.mkdir()
     third_party_lib_paths = _third_party_lib_paths()
     if third_party_lib_paths:
-        for path in third_party_lib_paths:
-            dest = lib_dir / path.name
-            dest.unlink(missing_ok=True)
-            shutil.copy(path, dest)
+        # Later paths win for equal file names as with sequential copies:
+        dests = {lib_dir / path.name: path for path in third_party_lib_paths}
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+            list(executor.map(_fast_copy, dests.values(), dests.keys()))
     _update_bundle_classpath(third_party_lib_paths)
     for path in (MANIFEST_PATH, PLUGIN_XML_PATH):
         if not path.is_file():
@@ -0,0 +1,221 @@
+import itertools
+import pathlib
+
+import pytest
+
+from eclipse_plugin_builders import __main__ as cli
+
+POM = """\
+<?xml version="1.0" encoding="UTF-8"?>
+<project xmlns="http://maven.apache.org/POM/4.0.0">
+  <modelVersion>4.0.0</modelVersion>
+  <groupId>com.example</groupId>
+  <artifactId>plugin</artifactId>
+  <version>1.0.0</version>
+</project>
+"""
+JAR_NAME = "com.example.plugin_1.0.0.jar"
+TARGET_PLATFORM_FILES = (
+    # lib with source
+    "plugins/org.foo_1.0.jar",
+    "plugins/org.foo.source_1.0.jar",
+    # libs without source
+    "plugins/org.bar_2.0.jar",
+    "plugins/nested/org.baz_3.0.jar",
+    "dropins/org.qux_1.0.jar",
+    "features/org.feat_1.0.jar",
+    # source without lib
+    "plugins/org.lonely.source_1.0.jar",
+    # blacklisted
+    "plugins/org.eclipse.pde.core_1.0.jar",
+    "plugins/org.egit_1.0.jar",
+    "plugins/org.egit.source_1.0.jar",
+    # the project's own jar
+    f"plugins/{JAR_NAME}",
+    # outside the lib dirs
+    "other/org.other_1.0.jar",
+    "other/org.paired_1.0.jar",
+    "other/org.paired.source_1.0.jar",
+    "org.top_1.0.jar",
+    "org.top.source_1.0.jar",
+)
+
+
+def _make_tree(root: pathlib.Path, files: tuple[str, ...]) -> None:
+    for file in files:
+        path = root / file
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+
+
+def _entries(
+    target_path: pathlib.Path, *, use_cache: bool = False, jobs: int = 1
+) -> list[tuple[str, str | None]]:
+    classpaths = cli._collect_target_platform_plugins(
+        target_path, use_cache=use_cache, jobs=jobs
+    )
+    return [(e.get("path"), e.get("sourcepath")) for e in classpaths]
+
+
+def _glob_entries(
+    target_path: pathlib.Path,
+) -> list[tuple[str, str | None]]:
+    """Collect the entries like the original glob based implementation."""
+    sources = set(target_path.glob("**/*.source_*.jar"))
+    libs = set(
+        itertools.chain.from_iterable(
+            target_path.glob(f"{d}/**/*.jar")
+            for d in cli.TARGET_PLATFORM_LIB_DIRS
+        )
+    )
+    libs = {lib for lib in libs - sources if lib.name != JAR_NAME}
+    entries: list[tuple[str, str | None]] = []
+    for src in sources:
+        if any(pattern in str(src) for pattern in cli.PATH_BLACKLIST):
+            continue
+        lib = src.parent / src.name.replace(".source_", "_")
+        libs.discard(lib)
+        if lib.is_file() and src.is_file():
+            entries.append((str(lib), str(src)))
+    for lib in libs:
+        if any(pattern in str(lib) for pattern in cli.PATH_BLACKLIST):
+            continue
+        if lib.is_file():
+            entries.append((str(lib), None))
+    return sorted(entries, key=lambda e: e[0])
+
+
+@pytest.fixture
+def project(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> pathlib.Path:
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "pom.xml").write_text(POM, encoding="utf-8")
+    monkeypatch.chdir(project)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    cli.compute_jar_name.cache_clear()
+    return project
+
+
+@pytest.fixture
+def target_path(tmp_path: pathlib.Path) -> pathlib.Path:
+    target_path = tmp_path / "capella"
+    _make_tree(target_path, TARGET_PLATFORM_FILES)
+    # A directory looking like a jar must not be picked up:
+    (target_path / "plugins" / "dir.jar").mkdir()
+    return target_path
+
+
+@pytest.mark.usefixtures("project")
+@pytest.mark.parametrize("jobs", [1, 4])
+def test_scan_matches_glob_baseline(
+    target_path: pathlib.Path, jobs: int
+) -> None:
+    entries = _entries(target_path, jobs=jobs)
+
+    assert entries == _glob_entries(target_path)
+    assert entries == [
+        (str(target_path / file), source and str(target_path / source))
+        for file, source in (
+            ("dropins/org.qux_1.0.jar", None),
+            ("features/org.feat_1.0.jar", None),
+            ("org.top_1.0.jar", "org.top.source_1.0.jar"),
+            ("other/org.paired_1.0.jar", "other/org.paired.source_1.0.jar"),
+            ("plugins/nested/org.baz_3.0.jar", None),
+            ("plugins/org.bar_2.0.jar", None),
+            ("plugins/org.foo_1.0.jar", "plugins/org.foo.source_1.0.jar"),
+        )
+    ]
+
+
+@pytest.mark.usefixtures("project")
+def test_scan_keeps_own_jar_if_paired_with_source(
+    target_path: pathlib.Path,
+) -> None:
+    (target_path / "plugins" / "com.example.plugin.source_1.0.0.jar").touch()
+
+    entries = _entries(target_path)
+
+    assert entries == _glob_entries(target_path)
+    assert (
+        str(target_path / "plugins" / JAR_NAME),
+        str(target_path / "plugins" / "com.example.plugin.source_1.0.0.jar"),
+    ) in entries
+
+
+def test_cache_miss_scans_and_hit_skips_scan(
+    project: pathlib.Path,
+    target_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    cache_dir = project.parent / "cache" / "eclipse-plugin-builders"
+    expected = _entries(target_path, use_cache=False)
+
+    assert _entries(target_path, use_cache=True) == expected
+    assert len(list(cache_dir.glob("*.json"))) == 1
+
+    def scan(*_: object) -> list[tuple[str, str | None]]:
+        raise AssertionError("target platform scanned on cache hit")
+
+    monkeypatch.setattr(cli, "_scan_target_platform", scan)
+    assert _entries(target_path, use_cache=True) == expected
+    assert not list(cache_dir.glob("tmp*"))
+
+
+@pytest.mark.usefixtures("project")
+def test_cache_is_invalidated_by_new_plugin(
+    target_path: pathlib.Path,
+) -> None:
+    _entries(target_path, use_cache=True)
+    new_jar = target_path / "plugins" / "org.new_1.0.jar"
+    new_jar.touch()
+
+    entries = _entries(target_path, use_cache=True)
+
+    assert (str(new_jar), None) in entries
+    assert entries == _entries(target_path, use_cache=False)
+
+
+@pytest.mark.usefixtures("project")
+@pytest.mark.parametrize("jobs", [1, 4])
+def test_scan_follows_symlinked_lib_dir(
+    tmp_path: pathlib.Path, jobs: int
+) -> None:
+    shared = tmp_path / "shared_plugins"
+    _make_tree(
+        shared,
+        (
+            "p_1.jar",
+            "p.source_1.jar",
+            "sub/q_2.jar",
+        ),
+    )
+    # Nested links are not followed, as with the original glob:
+    (shared / "sub" / "link").symlink_to(shared / "sub")
+    target_path = tmp_path / "capella"
+    target_path.mkdir()
+    (target_path / "plugins").symlink_to(shared)
+
+    entries = _entries(target_path, jobs=jobs)
+
+    plugins = target_path / "plugins"
+    assert entries == [
+        (str(plugins / "p_1.jar"), str(plugins / "p.source_1.jar")),
+        (str(plugins / "sub" / "q_2.jar"), None),
+    ]
+
+
+@pytest.mark.usefixtures("project")
+def test_cache_keeps_relative_and_absolute_target_apart(
+    target_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cli.compute_jar_name()  # cached, as `pom.xml` is in the project dir
+    with monkeypatch.context() as m:
+        m.chdir(target_path.parent)
+        relative = _entries(pathlib.Path(target_path.name), use_cache=True)
+
+    entries = _entries(target_path, use_cache=True)
+
+    assert relative[0][0] == "capella/dropins/org.qux_1.0.jar"
+    assert entries == _entries(target_path, use_cache=False)